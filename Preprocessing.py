@@ -1,5 +1,13 @@
+import hashlib
+import os
+import re
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
 import pandas as pd
 import numpy as np
+from python_calamine import CalamineWorkbook
 
 
 # ---------------------------------------------------
@@ -10,11 +18,75 @@ SHEETS_INDEX_FOOD = range(1, 76)
 SHEETS_INDEX_HOUSING_ENERGY = range(76, 109)   # non-overlapping with transport
 SHEETS_INDEX_TRANSPORT = range(109, 151)
 
+# Fixed category order: the position in this list is the categorical code.
+CATEGORY_NAMES = ["Food", "Housing & Energy", "Transport", "Other"]
+
+# Category code of every sheet index, so sheets are mapped with one gather.
+# Index 0 is never a data sheet and doubles as the 'Other' fallback.
+CATEGORY_CODE_BY_INDEX = np.full(SHEETS_INDEX_TRANSPORT.stop, 3, dtype=np.int8)
+CATEGORY_CODE_BY_INDEX[SHEETS_INDEX_FOOD] = 0
+CATEGORY_CODE_BY_INDEX[SHEETS_INDEX_HOUSING_ENERGY] = 1
+CATEGORY_CODE_BY_INDEX[SHEETS_INDEX_TRANSPORT] = 2
+
 
 # ---------------------------------------------------
 # Functions
 # ---------------------------------------------------
 
+def is_data_column(column) -> bool:
+    """
+    Tell whether a raw sheet column holds data, as opposed to an unnamed
+    column left over from merged cells (observation flags).
+    """
+    return not str(column).startswith("Unnamed")
+
+
+def sheet_to_arrays(df: pd.DataFrame) -> tuple:
+    """
+    Clean raw data extracted from a single Excel sheet into flat arrays.
+
+    This is the array-level core of `cleaning_dataframe`: the loaders stack
+    these arrays directly instead of building one DataFrame per sheet.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Raw DataFrame containing data from one Excel sheet.
+
+    Returns
+    -------
+    tuple
+        (countries, dates, hicp) arrays of equal length, one entry per
+        complete observation, in long (date-major) order.
+    """
+    # Filter out redundant columns (Excel merged columns) unless they were
+    # already dropped on ingest, and reshape the dataset from wide to long
+    # format for analytical readiness.
+
+    df = df.loc[:, [is_data_column(col) for col in df.columns]]
+
+    countries = df.iloc[:, 0].astype(str).to_numpy()
+    values = df.iloc[:, 1:].to_numpy()
+    n_countries, n_dates = values.shape
+
+    # Headers are ISO periods ('2020-01' monthly, '2020' annual): each one is
+    # parsed once, then broadcast to the rows of its column.
+    dates = pd.to_datetime(df.columns[1:], format="ISO8601").to_numpy()
+
+    # Wide to long by hand, in the same (date-major) row order as DataFrame.melt.
+    # calamine already returns numeric cells as floats; the only strings
+    # left are Excel placeholders (':', 'd', ...), coerced to NaN here.
+    # Eurostat publishes at most 2 decimals, so float32 is precise enough.
+    hicp = pd.to_numeric(values.ravel(order="F"), errors="coerce").astype(np.float32)
+
+    # Remove incomplete observations. Country and Date are always set, so a
+    # single mask over HICP is enough; the kept positions then pick their
+    # country (row) and date (column) without materializing the full grid.
+    kept = np.flatnonzero(~np.isnan(hicp))
+
+    return countries[kept % n_countries], dates[kept // n_countries], hicp[kept]
+
+
 def cleaning_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """
     Clean raw data extracted from a single Excel sheet.
@@ -28,44 +100,31 @@ def cleaning_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: A cleaned, long-format DataFrame ready for merging and analysis.
     """
-    
-    # Filter out redundant columns (Excel merged columns), 
-    # replace specific Excel placeholders (':', 'd') with NaN, and 
-    # reshape the dataset from wide to long format for analytical readiness.
-
-    df = (
-        df.iloc[:, [0] + [i for i in range(len(df.columns.to_list())) if i % 2 != 0]]
-          .replace(":", np.nan)
-          .replace("d", np.nan)
-          .reset_index(drop=True)
-          .rename(columns={"TIME": "Country"})
-          .melt(
-              id_vars="Country",
-              var_name="Date",
-              value_name="HICP"
-          )
-    )
-    
-    # Enforce strict data types and remove incomplete observations.
-    df["Country"] = df["Country"].astype(str)
-    df["Date"] = pd.to_datetime(df["Date"])
-    df["HICP"] = pd.to_numeric(df["HICP"], errors="coerce")
-    df.dropna(inplace=True)
+    countries, dates, hicp = sheet_to_arrays(df)
 
-    return df
+    # Country codes repeat across thousands of rows: store them as categories.
+    return pd.DataFrame({
+        "Country": pd.Categorical(countries),
+        "Date": dates,
+        "HICP": hicp,
+    })
 
 
-def load_summary(file_path: str, columns_map: dict, summary_sheet: str = "Summary") -> pd.DataFrame:
+def load_summary(file_path, columns_map: dict, summary_sheet: str = "Summary") -> pd.DataFrame:
     """
     Load and clean the 'Summary' sheet of an Excel workbook.
 
+    The sheet is streamed row by row with calamine and filtered in pure
+    Python, so only the requested columns of the kept rows reach pandas.
+
     Parameters
     ----------
-    file_path : str
-        Path to the Excel file.
+    file_path : str, pd.ExcelFile or CalamineWorkbook
+        Path to the Excel file, or a workbook already opened with calamine
+        (directly or through pd.ExcelFile with the 'calamine' engine).
     columns_map : dict
-        Mapping from raw column names (e.g. 'Unnamed: 1') to cleaned names
-        (e.g. 'sheet_name', 'description').
+        Mapping from raw column positions (e.g. 1 for column B) to cleaned
+        names (e.g. 'sheet_name', 'description').
     summary_sheet : str, optional
         Name of the summary sheet, by default 'Summary'.
 
@@ -74,18 +133,82 @@ def load_summary(file_path: str, columns_map: dict, summary_sheet: str = "Summar
     pd.DataFrame
         Cleaned summary DataFrame with renamed columns.
     """
-    df = pd.read_excel(file_path, sheet_name=summary_sheet)
+    if isinstance(file_path, pd.ExcelFile):
+        if file_path.engine != "calamine":
+            raise ValueError(
+                f"load_summary needs an ExcelFile opened with engine='calamine', got {file_path.engine!r}"
+            )
+        workbook = nullcontext(file_path.book)
+    elif isinstance(file_path, CalamineWorkbook):
+        workbook = nullcontext(file_path)
+    else:
+        workbook = CalamineWorkbook.from_path(file_path)
+
+    positions = list(columns_map.keys())
+    records = []
+
+    with workbook as wb:
+        rows = wb.get_sheet_by_name(summary_sheet).iter_rows()
+        # The first row is the header row, as with pd.read_excel
+        next(rows, None)
+
+        for row in rows:
+            values = [row[i] if i < len(row) else "" for i in positions]
+            # Remove header/info rows (e.g. 'Contents') and incomplete rows
+            if values[0] == "Contents" or any(v is None or v == "" for v in values):
+                continue
+            records.append(values)
+
+    return pd.DataFrame(records, columns=list(columns_map.values()))
+
+
+def load_sheet_labels(file_path: str, description_col: int, summary_sheet: str = "Summary") -> tuple:
+    """
+    List the data sheets of a workbook together with their descriptions.
 
-    cols_to_keep = list(columns_map.keys())
-    df = (
-        df
-        # Remove header/info rows (e.g. 'Contents')
-        .loc[df[cols_to_keep[0]] != "Contents", cols_to_keep]
-        .dropna()
-        .reset_index(drop=True)
-        .rename(columns=columns_map)
-    )
-    return df
+    The sheets to read come from the workbook's own sheet listing; the
+    summary sheet is only streamed for the sheet-name and description
+    columns, which provide the labels.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the Excel file.
+    description_col : int
+        Position of the description column in the summary sheet
+        (e.g. 4 for column E).
+    summary_sheet : str, optional
+        Name of the summary sheet, by default 'Summary'.
+
+    Returns
+    -------
+    tuple
+        (sheet_names, descriptions) lists, in workbook order. Sheets that
+        the summary does not describe are left out.
+
+    Raises
+    ------
+    ValueError
+        If the summary lists sheets that are missing from the workbook
+        (e.g. a truncated or partial export).
+    """
+    with CalamineWorkbook.from_path(file_path) as wb:
+        workbook_sheets = wb.sheet_names
+        summary = load_summary(
+            file_path=wb,
+            columns_map={1: "sheet_name", description_col: "description"},
+            summary_sheet=summary_sheet,
+        )
+
+    labels = dict(zip(summary["sheet_name"], summary["description"]))
+
+    missing = sorted(set(labels) - set(workbook_sheets))
+    if missing:
+        raise ValueError(f"Sheets listed in '{summary_sheet}' but missing from {file_path}: {missing}")
+
+    sheet_names = [name for name in workbook_sheets if name != summary_sheet and name in labels]
+
+    return sheet_names, [labels[name] for name in sheet_names]
 
 def map_sheet_to_category(sheet_name: str) -> str:
     """
@@ -102,18 +225,147 @@ def map_sheet_to_category(sheet_name: str) -> str:
     str
         One of: 'Food', 'Housing & Energy', 'Transport', or 'Other'.
     """
+    return CATEGORY_NAMES[map_sheets_to_category_codes([sheet_name])[0]]
+
+
+def map_sheets_to_category_codes(sheet_names: list) -> np.ndarray:
+    """
+    Vectorized counterpart of `map_sheet_to_category` for a list of sheets.
+
+    Parameters
+    ----------
+    sheet_names : list
+        Sheet names, assumed to end with an integer index (e.g. 'Sheet 23').
+
+    Returns
+    -------
+    np.ndarray
+        One code per sheet, indexing into `CATEGORY_NAMES`.
+    """
+    indices = np.fromiter((_sheet_index(name) for name in sheet_names), dtype=np.int64)
+    return CATEGORY_CODE_BY_INDEX[indices]
+
+
+def _sheet_index(sheet_name: str) -> int:
+    """
+    Parse the trailing integer of a sheet name into a row of
+    `CATEGORY_CODE_BY_INDEX`; anything unparsable or out of range maps to
+    0, i.e. 'Other'.
+    """
     try:
-        idx = int(sheet_name.split()[-1])
-    except Exception:
-        return "Other"
+        idx = int(str(sheet_name).split()[-1])
+    except (ValueError, IndexError):
+        return 0
+
+    return idx if 0 <= idx < len(CATEGORY_CODE_BY_INDEX) else 0
+
+
+def _read_and_clean(file_path: str, sheet_names: list, header_row: int) -> list:
+    """
+    Read a batch of data sheets from one workbook into cleaned arrays.
+
+    The workbook is opened once per batch: a calamine workbook handle
+    cannot be shared between threads, so each worker gets its own.
+    """
+    with pd.ExcelFile(file_path, engine="calamine") as xl:
+        return [
+            sheet_to_arrays(
+                # Skip the metadata rows and drop the flag columns on ingest
+                xl.parse(sheet_name, skiprows=header_row, usecols=is_data_column)
+            )
+            for sheet_name in sheet_names
+        ]
+
+
+def read_sheets(file_path: str, sheet_names: list, header_row: int) -> list:
+    """
+    Read and clean several data sheets of a workbook in parallel.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the Excel file.
+    sheet_names : list
+        Names of the data sheets to read.
+    header_row : int
+        Index of the header row (e.g. 8); the metadata rows above it are
+        skipped.
+
+    Returns
+    -------
+    list
+        One (countries, dates, hicp) tuple per sheet (see `sheet_to_arrays`),
+        in the same order as `sheet_names`.
+    """
+    # One contiguous batch of sheets per worker, so results keep the sheet order
+    n_workers = max(1, min(os.cpu_count() or 1, len(sheet_names)))
+    batch_size = max(1, -(-len(sheet_names) // n_workers))
+    batches = [sheet_names[i:i + batch_size] for i in range(0, len(sheet_names), batch_size)]
+
+    with ThreadPoolExecutor(max_workers=n_workers) as ex:
+        results = ex.map(lambda batch: _read_and_clean(file_path, batch, header_row), batches)
+        return [arrays for batch_arrays in results for arrays in batch_arrays]
+
+
+def stack_sheets(sheets: list) -> tuple:
+    """
+    Stack the cleaned arrays of several sheets into one long-format DataFrame.
+
+    The output columns are allocated once at their final size and each
+    sheet is copied into its own slice, so no per-sheet DataFrame or
+    concatenation is needed.
+
+    Parameters
+    ----------
+    sheets : list
+        (countries, dates, hicp) tuples, as returned by `read_sheets`.
+
+    Returns
+    -------
+    tuple
+        (df, lengths): the stacked DataFrame with columns
+        ['Country', 'Date', 'HICP'], and the number of rows of each sheet.
+    """
+    lengths = np.fromiter((len(hicp) for _, _, hicp in sheets), dtype=np.int64, count=len(sheets))
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    total = int(offsets[-1])
+    date_dtype = sheets[0][1].dtype if sheets else "datetime64[ns]"
 
-    if idx in SHEETS_INDEX_FOOD:
-        return "Food"
-    if idx in SHEETS_INDEX_HOUSING_ENERGY:
-        return "Housing & Energy"
-    if idx in SHEETS_INDEX_TRANSPORT:
-        return "Transport"
-    return "Other"
+    out_country = np.empty(total, dtype=object)
+    out_date = np.empty(total, dtype=date_dtype)
+    out_hicp = np.empty(total, dtype=np.float32)
+
+    for (countries, dates, hicp), start, end in zip(sheets, offsets[:-1], offsets[1:]):
+        out_country[start:end] = countries
+        out_date[start:end] = dates
+        out_hicp[start:end] = hicp
+
+    df = pd.DataFrame({
+        "Country": pd.Categorical(out_country),
+        "Date": out_date,
+        "HICP": out_hicp,
+    })
+    return df, lengths
+
+
+def repeat_categorical(values: list, lengths: np.ndarray) -> pd.Categorical:
+    """
+    Expand one value per sheet into a categorical column for the stacked rows.
+
+    Parameters
+    ----------
+    values : list
+        One value per sheet (e.g. the sheet descriptions).
+    lengths : np.ndarray
+        Number of rows contributed by each sheet.
+
+    Returns
+    -------
+    pd.Categorical
+        Categorical of length `lengths.sum()`, with sorted categories.
+    """
+    codes, categories = pd.factorize(np.asarray(values, dtype=object), sort=True)
+    return pd.Categorical.from_codes(np.repeat(codes, lengths), categories=categories)
 
 
 # ---------------------------------------------------
@@ -136,30 +388,16 @@ def load_main_dataset(file_main: str) -> pd.DataFrame:
         Long-format DataFrame with columns:
         ['Country', 'Date', 'HICP', 'label'].
     """
-    summary_main = load_summary(
-        file_path=file_main,
-        columns_map={
-            "Unnamed: 1": "sheet_name",
-            "Unnamed: 3": "base",
-            "Unnamed: 4": "description",
-        },
-    )
-
-    sheet_names_main = summary_main["sheet_name"].tolist()
-    descriptions_main = summary_main["description"].tolist()
+    sheet_names_main, descriptions_main = load_sheet_labels(file_main, description_col=4)
 
     # In this workbook, the actual header row for data starts at row index 8
-    main_header_row = [8]
+    main_header_row = 8
 
-    all_frames_main = []
+    sheets_main = read_sheets(file_main, sheet_names_main, main_header_row)
+    df_all, frame_lengths = stack_sheets(sheets_main)
 
-    for sheet_name, label in zip(sheet_names_main, descriptions_main):
-        sheet_df = pd.read_excel(file_main, sheet_name=sheet_name, header=main_header_row)
-        clean_df = cleaning_dataframe(sheet_df)
-        clean_df["label"] = label
-        all_frames_main.append(clean_df)
-
-    df_all = pd.concat(all_frames_main, axis=0, ignore_index=True)
+    # Attach sheet-level labels in one go, after stacking
+    df_all["label"] = repeat_categorical(descriptions_main, frame_lengths)
     return df_all
 
 
@@ -177,35 +415,26 @@ def load_detailed_dataset(file_details: str):
     tuple
         (df_all_items, df_food, df_housing_energy, df_transport)
     """
-    summary_details = load_summary(
-        file_path=file_details,
-        columns_map={
-            "Unnamed: 1": "sheet_name",
-            "Unnamed: 3": "base",
-            "Unnamed: 4": "description",
-        },
-    )
-
-    sheet_names_details = summary_details["sheet_name"].tolist()
-    descriptions_details = summary_details["description"].tolist()
-
-    details_header_row = [8]
+    sheet_names_details, descriptions_details = load_sheet_labels(file_details, description_col=4)
 
-    all_frames_items = []
+    details_header_row = 8
 
-    for sheet_name, label in zip(sheet_names_details, descriptions_details):
-        sheet_df = pd.read_excel(file_details, sheet_name=sheet_name, header=details_header_row)
-        clean_df = cleaning_dataframe(sheet_df)
-        clean_df["label"] = label
-        clean_df["Category"] = map_sheet_to_category(sheet_name)
-        all_frames_items.append(clean_df)
+    sheets_details = read_sheets(file_details, sheet_names_details, details_header_row)
+    df_all_items, frame_lengths = stack_sheets(sheets_details)
 
-    df_all_items = pd.concat(all_frames_items, axis=0, ignore_index=True)
+    # Attach sheet-level labels and categories in one go, after stacking
+    category_codes = map_sheets_to_category_codes(sheet_names_details)
+    df_all_items["label"] = repeat_categorical(descriptions_details, frame_lengths)
+    df_all_items["Category"] = pd.Categorical.from_codes(
+        np.repeat(category_codes, frame_lengths), categories=CATEGORY_NAMES
+    )
 
-    # Convenience DataFrames by main category
-    df_food = df_all_items[df_all_items["Category"] == "Food"].copy()
-    df_housing_energy = df_all_items[df_all_items["Category"] == "Housing & Energy"].copy()
-    df_transport = df_all_items[df_all_items["Category"] == "Transport"].copy()
+    # Convenience DataFrames by main category, partitioned in a single pass
+    groups = dict(tuple(df_all_items.groupby("Category", observed=True, sort=False)))
+    empty = df_all_items.iloc[:0]
+    df_food = groups.get("Food", empty)
+    df_housing_energy = groups.get("Housing & Energy", empty)
+    df_transport = groups.get("Transport", empty)
 
     return df_all_items, df_food, df_housing_energy, df_transport
 
@@ -225,28 +454,15 @@ def load_weights_dataset(file_weights: str) -> pd.DataFrame:
         Long-format DataFrame with columns:
         ['Country', 'Date', 'HICP', 'label'] for the weights.
     """
-    summary_weights = load_summary(
-        file_path=file_weights,
-        columns_map={
-            "Unnamed: 1": "sheet_name",
-            "Unnamed: 3": "description",
-        },
-    )
-
-    sheet_names_weights = summary_weights["sheet_name"].tolist()
-    descriptions_weights = summary_weights["description"].tolist()
+    sheet_names_weights, descriptions_weights = load_sheet_labels(file_weights, description_col=3)
 
-    weights_header_row = [7]
+    weights_header_row = 7
 
-    weight_frames = []
+    sheets_weights = read_sheets(file_weights, sheet_names_weights, weights_header_row)
+    df_weights, frame_lengths = stack_sheets(sheets_weights)
 
-    for sheet_name, label in zip(sheet_names_weights, descriptions_weights):
-        sheet_df = pd.read_excel(file_weights, sheet_name=sheet_name, header=weights_header_row)
-        clean_df = cleaning_dataframe(sheet_df)
-        clean_df["label"] = label
-        weight_frames.append(clean_df)
-
-    df_weights = pd.concat(weight_frames, axis=0, ignore_index=True)
+    # Attach sheet-level labels in one go, after stacking
+    df_weights["label"] = repeat_categorical(descriptions_weights, frame_lengths)
     return df_weights
 
 
@@ -254,10 +470,119 @@ def load_weights_dataset(file_weights: str) -> pd.DataFrame:
 # High-level loader
 # ---------------------------------------------------
 
+# Bump when the cleaning logic changes so stale caches are not reused.
+CACHE_VERSION = "v1"
+
+DATASET_NAMES = (
+    "df_all",
+    "df_all_items",
+    "df_food",
+    "df_housing_energy",
+    "df_transport",
+    "df_weights",
+)
+
+# Names of the files written by `cache_paths` / `write_cache`:
+# <version>_<source set id>_<source state id>_<dataset>.parquet[.tmp]
+CACHE_FILE_PATTERN = re.compile(
+    r"(?P<version>v\d+)_(?P<sources>[0-9a-f]{8})_(?P<state>[0-9a-f]{16})_"
+    r"(?P<name>" + "|".join(DATASET_NAMES) + r")\.parquet(?:\.tmp)?"
+)
+
+
+def cache_paths(cache_dir: str, source_files: list) -> dict:
+    """
+    Build the Parquet cache path of each dataset for a given set of source files.
+
+    The file names embed a hash of the workbook paths, which identifies the
+    set of sources, and a hash of each workbook's path, size and modification
+    time, so editing or replacing any workbook (even with an older
+    timestamp) invalidates the cache.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory holding the cached Parquet files.
+    source_files : list
+        Paths of the Excel workbooks the datasets are built from.
+
+    Returns
+    -------
+    dict
+        Mapping from dataset name (see `DATASET_NAMES`) to Parquet path.
+    """
+    sources = hashlib.sha1()
+    state = hashlib.sha1()
+    for path in source_files:
+        stat = os.stat(path)
+        sources.update(f"{os.path.abspath(path)}\n".encode())
+        state.update(f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+    key = f"{CACHE_VERSION}_{sources.hexdigest()[:8]}_{state.hexdigest()[:16]}"
+
+    return {name: os.path.join(cache_dir, f"{key}_{name}.parquet") for name in DATASET_NAMES}
+
+
+def write_cache(datasets: dict, paths: dict) -> bool:
+    """
+    Save the datasets to their Parquet cache paths, on a best-effort basis.
+
+    Each file is written under a temporary name and then renamed, so an
+    interrupted run never leaves a partial file. If the cache cannot be
+    written (pyarrow missing, read-only directory, ...), a warning is issued
+    and the datasets are simply not cached. After a successful write, cache
+    files left over from older keys of the same source files (including
+    temporary files of interrupted runs) are removed; any other file in the
+    directory, and caches of other source files, are left untouched.
+
+    Parameters
+    ----------
+    datasets : dict
+        Mapping from dataset name to DataFrame.
+    paths : dict
+        Mapping from dataset name to Parquet path, as built by `cache_paths`.
+
+    Returns
+    -------
+    bool
+        True if every dataset was written to the cache.
+    """
+    tmp_path = None
+    try:
+        for name, df in datasets.items():
+            os.makedirs(os.path.dirname(paths[name]) or ".", exist_ok=True)
+            tmp_path = paths[name] + ".tmp"
+            df.to_parquet(tmp_path, compression="zstd")
+            os.replace(tmp_path, paths[name])
+            tmp_path = None
+    except (ImportError, OSError) as exc:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        warnings.warn(f"Could not write the Parquet cache: {exc}")
+        return False
+
+    # Prune the files of older cache keys for the same source files
+    current = {os.path.abspath(path) for path in paths.values()}
+    any_path = next(iter(paths.values()))
+    cache_dir = os.path.dirname(any_path) or "."
+    source_id = CACHE_FILE_PATTERN.fullmatch(os.path.basename(any_path))["sources"]
+
+    for entry in os.listdir(cache_dir):
+        match = CACHE_FILE_PATTERN.fullmatch(entry)
+        stale = os.path.abspath(os.path.join(cache_dir, entry))
+        if match is None or match["sources"] != source_id or stale in current:
+            continue
+        try:
+            os.remove(stale)
+        except OSError:
+            pass
+    return True
+
+
 def load_all_data(
     file_main: str = r"eu_hicp_datasets\hicp_main_categories_eu.xlsx",
     file_details: str = r"eu_hicp_datasets\hicp_subcategories_eu.xlsx",
     file_weights: str = r"eu_hicp_datasets\coicop_weights_eu.xlsx",
+    cache_dir: str = "cache",
 ):
     """
     Load all datasets (main HICP, detailed items, and weights) in one call.
@@ -270,6 +595,11 @@ def load_all_data(
         Path to the detailed subcategory dataset.
     file_weights : str, optional
         Path to the COICOP weights dataset.
+    cache_dir : str, optional
+        Directory where the cleaned datasets are cached as Parquet files,
+        by default 'cache'. On later calls with unchanged workbooks the
+        datasets are read back from there instead of from Excel.
+        Pass None to disable the cache.
 
     Returns
     -------
@@ -282,11 +612,16 @@ def load_all_data(
             - 'df_transport'
             - 'df_weights'
     """
+    if cache_dir is not None:
+        paths = cache_paths(cache_dir, [file_main, file_details, file_weights])
+        if all(os.path.exists(path) for path in paths.values()):
+            return {name: pd.read_parquet(path) for name, path in paths.items()}
+
     df_all = load_main_dataset(file_main)
     df_all_items, df_food, df_housing_energy, df_transport = load_detailed_dataset(file_details)
     df_weights = load_weights_dataset(file_weights)
 
-    return {
+    datasets = {
         "df_all": df_all,
         "df_all_items": df_all_items,
         "df_food": df_food,
@@ -294,3 +629,8 @@ def load_all_data(
         "df_transport": df_transport,
         "df_weights": df_weights,
     }
+
+    if cache_dir is not None:
+        write_cache(datasets, paths)
+
+    return datasets